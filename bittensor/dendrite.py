@@ -44,6 +44,7 @@ class dendrite(torch.nn.Module):
         keypair: The wallet or keypair used for signing messages.
         external_ip (str): The external IP address of the local system.
         synapse_history (list): A list of Synapse objects representing the historical responses.
+        max_connections (int): The maximum number of simultaneous connections to axons.
 
     Methods:
         __str__(): Returns a string representation of the Dendrite object.
@@ -95,7 +96,9 @@ class dendrite(torch.nn.Module):
     """
 
     def __init__(
-        self, wallet: Optional[Union[bittensor.wallet, bittensor.Keypair]] = None
+        self,
+        wallet: Optional[Union[bittensor.wallet, bittensor.Keypair]] = None,
+        max_connections: int = 256,
     ):
         """
         Initializes the Dendrite object, setting up essential properties.
@@ -103,6 +106,8 @@ class dendrite(torch.nn.Module):
         Args:
             wallet (Optional[Union['bittensor.wallet', 'bittensor.keypair']], optional):
                 The user's wallet or keypair used for signing messages. Defaults to ``None``, in which case a new :func:`bittensor.wallet().hotkey` is generated and used.
+            max_connections (int, optional): The maximum number of simultaneous connections held by the client session.
+                Defaults to ``256``, the maximum number of UIDs on a subnet, so that a full metagraph can be queried at once.
         """
         # Initialize the parent class
         super(dendrite, self).__init__()
@@ -120,6 +125,8 @@ class dendrite(torch.nn.Module):
 
         self.synapse_history: list = []
 
+        self.max_connections = max_connections
+
         self._session: Optional[aiohttp.ClientSession] = None
 
     @property
@@ -131,6 +138,10 @@ class dendrite(torch.nn.Module):
         initializes the `aiohttp.ClientSession <https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.ClientSession>`_ on its first use. The session is then reused for subsequent
         HTTP requests, offering performance benefits by reusing underlying connections.
 
+        The session's connector allows up to ``max_connections`` simultaneous connections, so that
+        :func:`forward` can keep a request in flight to every axon of a metagraph at once rather than
+        queueing them behind aiohttp's default limit of 100 connections.
+
         This is used internally by the dendrite when querying axons, and should not be used directly
         unless absolutely necessary for your application.
 
@@ -155,7 +166,9 @@ class dendrite(torch.nn.Module):
 
         """
         if self._session is None:
-            self._session = aiohttp.ClientSession()
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections)
+            )
         return self._session
 
     def close_session(self):
@@ -700,7 +713,7 @@ class dendrite(torch.nn.Module):
             # server's state only if the protocol allows mutation. To prevent overwrites,
             # the protocol must set allow_mutation = False
             server_synapse = local_synapse.__class__(**json_response)
-            for key in local_synapse.dict().keys():
+            for key in local_synapse.__fields__:
                 try:
                     # Set the attribute in the local synapse from the corresponding
                     # attribute in the server synapse
@@ -22,7 +22,6 @@ import json
 import sys
 
 import pydantic
-from pydantic.schema import schema
 import bittensor
 from typing import Optional, List, Any, Dict
 
@@ -628,17 +627,16 @@ class Synapse(pydantic.BaseModel):
         # Getting the fields of the instance
         instance_fields = self.dict()
 
+        # Getting the required fields once from the class schema, which pydantic caches per class
+        required = self.__class__.schema().get("required")
+
         # Iterating over the fields of the instance
         for field, value in instance_fields.items():
-            # If the object is not optional, serializing it, encoding it, and adding it to the headers
-            required = schema([self.__class__])["definitions"][self.name].get(
-                "required"
-            )
-
             # Skipping the field if it's already in the headers or its value is None
             if field in headers or value is None:
                 continue
 
+            # If the object is not optional, serializing it, encoding it, and adding it to the headers
             elif required and field in required:
                 try:
                     # create an empty (dummy) instance of type(value) to pass pydantic validation on the axon side
@@ -686,16 +684,12 @@ class Synapse(pydantic.BaseModel):
         # Hash the body for verification
         hashes = []
 
-        # Getting the fields of the instance
-        instance_fields = self.dict()
+        # Getting only the fields required for the hash, in field definition order,
+        # rather than serializing the whole instance.
+        instance_fields = self.dict(include=set(self.required_hash_fields or []))
 
         for field, value in instance_fields.items():
-            # If the field is required in the subclass schema, hash and add it.
-            if (
-                self.required_hash_fields is not None
-                and field in self.required_hash_fields
-            ):
-                hashes.append(bittensor.utils.hash(str(value)))
+            hashes.append(bittensor.utils.hash(str(value)))
 
         # Hash and return the hashes that have been concatenated
         return bittensor.utils.hash("".join(hashes))
@@ -166,7 +166,8 @@ class Tensor(pydantic.BaseModel):
         shape = list(tensor.shape)
         if len(shape) == 0:
             shape = [0]
-        torch_numpy = tensor.cpu().detach().numpy().copy()
+        # No explicit copy: msgpack_numpy packs C-contiguous arrays from their own memory and copies the rest itself.
+        torch_numpy = tensor.detach().cpu().numpy()
         data_buffer = base64.b64encode(
             msgpack.packb(torch_numpy, default=msgpack_numpy.encode)
         ).decode("utf-8")
@@ -93,6 +93,24 @@ async def test_aclose(setup_dendrite, setup_axon):
     assert dendrite_obj._session == None
 
 
+@pytest.mark.asyncio
+async def test_session_connection_limit(setup_dendrite):
+    dendrite_obj = setup_dendrite
+    async with dendrite_obj:
+        session = await dendrite_obj.session
+        # The connector is bounded, but wide enough to query a full metagraph at once
+        assert session.connector.limit == dendrite_obj.max_connections == 256
+        assert session is await dendrite_obj.session
+
+
+@pytest.mark.asyncio
+async def test_session_custom_connection_limit():
+    dendrite_obj = bittensor.dendrite(_get_mock_wallet(), max_connections=1024)
+    async with dendrite_obj:
+        session = await dendrite_obj.session
+        assert session.connector.limit == 1024
+
+
 class AsyncMock(Mock):
     def __call__(self, *args, **kwargs):
         sup = super(AsyncMock, self)
@@ -19,6 +19,7 @@ import torch
 import base64
 import typing
 import pytest
+import pydantic
 import bittensor
 
 
@@ -224,3 +225,49 @@ def test_default_instance_fields_dict_consistency():
         "computed_body_hash": "",
         "required_hash_fields": [],
     }
+
+
+def test_required_fields_in_headers():
+    class Test(bittensor.Synapse):
+        a: int
+        b: typing.List[int]
+        c: typing.Optional[int] = None
+
+    synapse = Test(a=1, b=[1, 2], c=3)
+
+    # Only required fields are carried through the headers, repeatedly and identically
+    for _ in range(2):
+        headers = synapse.to_headers()
+        assert "bt_header_input_obj_a" in headers
+        assert "bt_header_input_obj_b" in headers
+        assert "bt_header_input_obj_c" not in headers
+
+    next_synapse = Test.from_headers(headers)
+    assert next_synapse.a == 0
+    assert next_synapse.b == []
+    assert next_synapse.c == None
+
+
+def test_body_hash_required_fields_only():
+    class Test(bittensor.Synapse):
+        a: int
+        b: typing.List[int]
+        c: typing.Optional[str] = None
+        required_hash_fields: typing.List[str] = pydantic.Field(
+            ["b", "a"], allow_mutation=False
+        )
+
+    synapse = Test(a=1, b=[1, 2, 3], c="not hashed")
+
+    # Hashes are concatenated in field definition order, not required_hash_fields order
+    expected = bittensor.utils.hash(
+        bittensor.utils.hash(str(1)) + bittensor.utils.hash(str([1, 2, 3]))
+    )
+    assert synapse.body_hash == expected
+
+    # Fields outside required_hash_fields do not affect the hash
+    synapse.c = "changed"
+    assert synapse.body_hash == expected
+
+    # With no required fields the hash is that of an empty body
+    assert bittensor.Synapse().body_hash == bittensor.utils.hash("")
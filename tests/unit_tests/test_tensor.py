@@ -135,3 +135,14 @@ def test_serialize_all_types_equality():
 
     torchtensor = torch.randn([100], dtype=torch.float32) < 0.5
     assert torch.all(bittensor.tensor(torchtensor).tensor() == torchtensor)
+
+
+def test_serialize_non_contiguous_and_grad():
+    torchtensor = torch.randn([4, 3], dtype=torch.float32).t()
+    assert not torchtensor.is_contiguous()
+    assert torch.all(bittensor.tensor(torchtensor).tensor() == torchtensor)
+
+    torchtensor = torch.randn([4, 3], dtype=torch.float32, requires_grad=True)
+    deserialized = bittensor.tensor(torchtensor).tensor()
+    assert not deserialized.requires_grad
+    assert torch.all(deserialized == torchtensor.detach())